@@ -4,7 +4,7 @@ import pytest
 from pytest_lazyfixture import lazy_fixture
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def file_df_schema():
     from pyspark.sql.types import (
         DateType,
@@ -28,7 +28,7 @@ def file_df_schema():
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def file_df_schema_str_value_last():
     # partitioned dataframe has "str_value" column moved to the end
     from pyspark.sql.types import (
@@ -53,8 +53,10 @@ def file_df_schema_str_value_last():
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def file_df_dataframe(spark, file_df_schema):
+    from pyspark import StorageLevel
+
     data = [
         [1, "val1", 123, datetime.date(2021, 1, 1), datetime.datetime(2021, 1, 1, 1, 1, 1), 1.23],
         [2, "val1", 234, datetime.date(2022, 2, 2), datetime.datetime(2022, 2, 2, 2, 2, 2), 2.34],
@@ -64,7 +66,16 @@ def file_df_dataframe(spark, file_df_schema):
         [6, "val3", 678, datetime.date(2026, 6, 6), datetime.datetime(2026, 6, 6, 6, 6, 6), 6.78],
         [7, "val3", 789, datetime.date(2027, 7, 7), datetime.datetime(2027, 7, 7, 7, 7, 7), 7.89],
     ]
-    return spark.createDataFrame(data, schema=file_df_schema)
+    df = spark.createDataFrame(data, schema=file_df_schema)
+
+    # dataframe is used by almost every test, so calculate it only once.
+    # it is created from Python objects, not from files, and Spark caches it in columnar format,
+    # so there is nothing to gain from writing it to Parquet and reading back
+    df.persist(StorageLevel.MEMORY_ONLY)
+    df.count()
+
+    yield df
+    df.unpersist()
 
 
 @pytest.fixture(
@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from onetl._util.spark import get_pyspark_version
+from onetl._util.spark import get_pyspark_version, get_spark_version
 
 
 @pytest.fixture(scope="session")
@@ -111,3 +111,8 @@ def get_spark_session(warehouse_dir, spark_metastore_dir, ivysettings_path, mave
     yield spark
     spark.sparkContext.stop()
     spark.stop()
+
+
+@pytest.fixture(scope="session")
+def spark_major_version(spark):
+    return get_spark_version(spark).major
@@ -12,118 +12,133 @@ import secrets
 
 import pytest
 
-from onetl._util.spark import get_spark_version
 from onetl.file import FileDFReader
 from onetl.file.format import CSV
 
 try:
-    from pyspark.sql.types import (
-        DateType,
-        DoubleType,
-        IntegerType,
-        StructField,
-        StructType,
-        TimestampType,
-    )
+    from pyspark.sql.types import StructType
 
     from tests.util.assert_df import assert_equal_df
 except ImportError:
     # pandas and spark can be missing if someone runs tests for file connections only
     pass
 
+# run all tests of this module in the same pytest-xdist worker, to reuse its Spark session
+pytestmark = pytest.mark.xdist_group(name="file_df_reader")
+
+
+@pytest.fixture()
+def csv_root_without_header(file_df_connection_with_path_and_files):
+    _, source_path, _ = file_df_connection_with_path_and_files
+    return source_path / "csv/without_header"
+
+
+@pytest.fixture()
+def csv_root_nested(file_df_connection_with_path_and_files):
+    _, source_path, _ = file_df_connection_with_path_and_files
+    return source_path / "csv/nested"
+
+
+@pytest.fixture()
+def csv_root_partitioned(file_df_connection_with_path_and_files):
+    _, source_path, _ = file_df_connection_with_path_and_files
+    return source_path / "csv/partitioned"
+
+
+def filter_files_by_root(files, root):
+    # compare string prefixes instead of walking through file.parents for each file
+    prefix = root.as_posix().rstrip("/") + "/"
+    return [file for file in files if file.as_posix().startswith(prefix)]
+
 
 def test_file_df_reader_run(
     file_df_connection_with_path_and_files,
+    csv_root_without_header,
     file_df_dataframe,
 ):
-    file_df_connection, source_path, _ = file_df_connection_with_path_and_files
+    file_df_connection, _, _ = file_df_connection_with_path_and_files
     df = file_df_dataframe
-    csv_root = source_path / "csv/without_header"
 
     reader = FileDFReader(
         connection=file_df_connection,
         format=CSV(),
-        source_path=csv_root,
+        source_path=csv_root_without_header,
         df_schema=df.schema,
     )
     read_df = reader.run()
 
-    assert read_df.count()
+    assert read_df.take(1)
     assert read_df.schema == df.schema
     assert_equal_df(read_df, file_df_dataframe)
 
 
-@pytest.mark.parametrize(
-    "pass_source_path",
-    [False, True],
-    ids=["Without source_path", "With source_path"],
-)
 def test_file_df_reader_run_with_files(
     file_df_connection_with_path_and_files,
+    csv_root_without_header,
     file_df_dataframe,
-    pass_source_path,
     caplog,
 ):
-    file_df_connection, source_path, uploaded_files = file_df_connection_with_path_and_files
+    file_df_connection, _, uploaded_files = file_df_connection_with_path_and_files
     df = file_df_dataframe
+    csv_files = filter_files_by_root(uploaded_files, csv_root_without_header)
 
-    csv_root = source_path / "csv/without_header"
-    csv_files = [file for file in uploaded_files if csv_root in file.parents]
-
-    reader = FileDFReader(
+    reader_without_source_path = FileDFReader(
+        connection=file_df_connection,
+        format=CSV(),
+        df_schema=df.schema,
+    )
+    reader_with_source_path = FileDFReader(
         connection=file_df_connection,
         format=CSV(),
-        source_path=csv_root if pass_source_path else None,
+        source_path=csv_root_without_header,
         df_schema=df.schema,
     )
 
+    read_df = reader_without_source_path.run(csv_files)
+
     with caplog.at_level(logging.WARNING):
-        read_df = reader.run(csv_files)
+        read_df_with_source_path = reader_with_source_path.run(csv_files)
+
+        assert (
+            "Passed both `source_path` and files list at the same time. Using explicit files list"
+        ) in caplog.text
 
-        if pass_source_path:
-            assert (
-                "Passed both `source_path` and files list at the same time. Using explicit files list"
-            ) in caplog.text
+    # explicit files list takes precedence, so both readers read the same files.
+    # compare only the result of one reader to avoid running the same Spark job twice
+    assert read_df_with_source_path.schema == read_df.schema
+    # DataFrame.inputFiles() was added to PySpark only in 3.1, so call JVM method directly
+    assert sorted(read_df_with_source_path._jdf.inputFiles()) == sorted(read_df._jdf.inputFiles())
 
-    assert read_df.count()
+    assert read_df.take(1)
     assert read_df.schema == df.schema
     assert_equal_df(read_df, df)
 
 
 def test_file_df_reader_run_with_files_relative_and_source_path(
     file_df_connection_with_path_and_files,
+    csv_root_without_header,
     file_df_dataframe,
 ):
-    file_df_connection, source_path, uploaded_files = file_df_connection_with_path_and_files
+    file_df_connection, _, uploaded_files = file_df_connection_with_path_and_files
     df = file_df_dataframe
-    csv_root = source_path / "csv/without_header"
 
-    csv_files = [file for file in uploaded_files if csv_root in file.parents]
-    relative_files_path = [file.relative_to(csv_root) for file in csv_files]
+    csv_files = filter_files_by_root(uploaded_files, csv_root_without_header)
+    relative_files_path = [file.relative_to(csv_root_without_header) for file in csv_files]
 
     reader = FileDFReader(
         connection=file_df_connection,
         format=CSV(),
-        source_path=csv_root,
+        source_path=csv_root_without_header,
         df_schema=df.schema,
     )
 
-    read_df = reader.run(file for file in relative_files_path)
+    read_df = reader.run(relative_files_path)
 
-    assert read_df.count()
+    assert read_df.take(1)
     assert read_df.schema == df.schema
     assert_equal_df(read_df, df)
 
 
-def test_file_df_reader_run_without_files_and_source_path(file_df_connection):
-    reader = FileDFReader(
-        connection=file_df_connection,
-        format=CSV(),
-    )
-    with pytest.raises(ValueError, match="Neither file list nor `source_path` are passed"):
-        reader.run()
-
-
 @pytest.mark.parametrize(
     "pass_source_path",
     [False, True],
@@ -143,33 +158,10 @@ def test_file_df_reader_run_with_empty_files_input(
     )
 
     read_df = reader.run([])  # this argument takes precedence
-    assert not read_df.count()
+    assert not read_df.take(1)
     assert read_df.schema == file_df_schema
 
 
-def test_file_df_reader_run_relative_path_without_source_path(file_df_connection):
-    reader = FileDFReader(
-        connection=file_df_connection,
-        format=CSV(),
-    )
-
-    with pytest.raises(ValueError, match="Cannot pass relative file path with empty `source_path`"):
-        reader.run(["some/relative/path/file.txt"])
-
-
-def test_file_df_reader_run_absolute_path_not_match_source_path(file_df_connection_with_path_and_files):
-    file_df_connection, source_path, _ = file_df_connection_with_path_and_files
-    reader = FileDFReader(
-        connection=file_df_connection,
-        format=CSV(),
-        source_path=source_path,
-    )
-
-    error_message = f"File path '/some/relative/path/file.txt' does not match source_path '{source_path}'"
-    with pytest.raises(ValueError, match=error_message):
-        reader.run(["/some/relative/path/file.txt"])
-
-
 def test_file_df_reader_source_path_does_not_exist(file_df_connection, file_df_schema):
     source_path = f"/tmp/test_read_{secrets.token_hex(5)}"
 
@@ -184,9 +176,13 @@ def test_file_df_reader_source_path_does_not_exist(file_df_connection, file_df_s
         reader.run()
 
 
-def test_file_df_reader_source_path_cannot_be_file(file_df_connection_with_path_and_files, file_df_schema):
-    file_df_connection, source_path, _ = file_df_connection_with_path_and_files
-    csv_file = source_path / "csv/without_header/file.csv"
+def test_file_df_reader_source_path_cannot_be_file(
+    file_df_connection_with_path_and_files,
+    csv_root_without_header,
+    file_df_schema,
+):
+    file_df_connection, _, _ = file_df_connection_with_path_and_files
+    csv_file = csv_root_without_header / "file.csv"
 
     reader = FileDFReader(
         connection=file_df_connection,
@@ -199,103 +195,92 @@ def test_file_df_reader_source_path_cannot_be_file(file_df_connection_with_path_
         reader.run()
 
 
-def test_file_df_reader_run_recursive_false(spark, file_df_connection_with_path_and_files, file_df_schema):
-    spark_version = get_spark_version(spark)
-    if spark_version.major < 3:
-        pytest.skip("Option `recursive` is not supported on Spark 2")
-
-    file_df_connection, source_path, _ = file_df_connection_with_path_and_files
-
-    reader = FileDFReader(
-        connection=file_df_connection,
-        format=CSV(),
-        source_path=source_path / "csv/nested",
-        df_schema=file_df_schema,
-        options=FileDFReader.Options(recursive=False),
-    )
-
-    read_df = reader.run()
-    assert not read_df.count()
-
-
-def test_file_df_reader_run_recursive_true(
-    spark,
+@pytest.mark.parametrize(
+    "recursive",
+    [False, True],
+    ids=["Non-recursive", "Recursive"],
+)
+def test_file_df_reader_run_recursive(
+    spark_major_version,
     file_df_connection_with_path_and_files,
+    csv_root_nested,
     file_df_dataframe,
+    recursive,
 ):
-    spark_version = get_spark_version(spark)
-    if spark_version.major < 3:
+    if spark_major_version < 3:
         pytest.skip("Option `recursive` is not supported on Spark 2")
 
-    file_df_connection, source_path, _ = file_df_connection_with_path_and_files
+    file_df_connection, _, _ = file_df_connection_with_path_and_files
     df = file_df_dataframe
 
     reader = FileDFReader(
         connection=file_df_connection,
         format=CSV(),
-        source_path=source_path / "csv/nested",
+        source_path=csv_root_nested,
         df_schema=df.schema,
-        options=FileDFReader.Options(recursive=True),
+        options=FileDFReader.Options(recursive=recursive),
     )
     read_df = reader.run()
-
-    assert read_df.count()
     assert read_df.schema == df.schema
-    assert_equal_df(read_df, df, order_by="id")
+
+    if recursive:
+        assert read_df.take(1)
+        assert_equal_df(read_df, df, order_by="id")
+    else:
+        # all files are located in nested directories
+        assert not read_df.take(1)
 
 
 def test_file_df_reader_run_partitioned(
     file_df_connection_with_path_and_files,
+    csv_root_partitioned,
     file_df_schema_str_value_last,
     file_df_dataframe,
 ):
-    file_df_connection, source_path, _ = file_df_connection_with_path_and_files
+    file_df_connection, _, _ = file_df_connection_with_path_and_files
     df = file_df_dataframe
 
     reader = FileDFReader(
         connection=file_df_connection,
         format=CSV(),
-        source_path=source_path / "csv/partitioned",
+        source_path=csv_root_partitioned,
         df_schema=df.schema,
     )
 
     read_df = reader.run()
 
-    assert read_df.count()
+    assert read_df.take(1)
     assert read_df.schema == file_df_schema_str_value_last
     assert_equal_df(read_df, df, order_by="id")
 
 
-def test_file_df_reader_run_partitioned_recursive(spark, file_df_connection_with_path_and_files, file_df_dataframe):
-    spark_version = get_spark_version(spark)
-    if spark_version.major < 3:
+def test_file_df_reader_run_partitioned_recursive(
+    spark_major_version,
+    file_df_connection_with_path_and_files,
+    csv_root_partitioned,
+    file_df_schema,
+    file_df_dataframe,
+):
+    if spark_major_version < 3:
         pytest.skip("Option `recursive` is not supported on Spark 2")
 
-    file_df_connection, source_path, _ = file_df_connection_with_path_and_files
+    file_df_connection, _, _ = file_df_connection_with_path_and_files
 
     # csv does not contain "str_value" column.
     # do not pass it to df_schema, otherwise dataframe will be corrupted - "date_value" column will contain string value
-    real_df_schema = StructType(
-        [
-            StructField("id", IntegerType()),
-            StructField("int_value", IntegerType()),
-            StructField("date_value", DateType()),
-            StructField("datetime_value", TimestampType()),
-            StructField("float_value", DoubleType()),
-        ],
-    )
+    real_df_schema = StructType([field for field in file_df_schema.fields if field.name != "str_value"])
 
     reader = FileDFReader(
         connection=file_df_connection,
         format=CSV(),
-        source_path=source_path / "csv/partitioned",
+        source_path=csv_root_partitioned,
         df_schema=real_df_schema,
         options=FileDFReader.Options(recursive=True),
     )
 
     read_df = reader.run()
 
-    assert read_df.count()
+    assert read_df.take(1)
     assert read_df.schema == real_df_schema
 
     expected_df = file_df_dataframe.drop("str_value")
@@ -1,6 +1,43 @@
+import re
+
+import pytest
+
+from onetl.connection import SparkLocalFS
 from onetl.file import FileDFReader
+from onetl.file.format import CSV
 
 
 def test_file_df_reader_unknown_options():
     options = FileDFReader.Options(unknown="abc")
     assert options.unknown == "abc"
+
+
+def test_file_df_reader_run_without_files_and_source_path(spark_mock):
+    reader = FileDFReader(
+        connection=SparkLocalFS(spark=spark_mock),
+        format=CSV(),
+    )
+    with pytest.raises(ValueError, match="Neither file list nor `source_path` are passed"):
+        reader.run()
+
+
+def test_file_df_reader_run_relative_path_without_source_path(spark_mock):
+    reader = FileDFReader(
+        connection=SparkLocalFS(spark=spark_mock),
+        format=CSV(),
+    )
+
+    with pytest.raises(ValueError, match="Cannot pass relative file path with empty `source_path`"):
+        reader.run(["some/relative/path/file.txt"])
+
+
+def test_file_df_reader_run_absolute_path_not_match_source_path(spark_mock):
+    reader = FileDFReader(
+        connection=SparkLocalFS(spark=spark_mock),
+        format=CSV(),
+        source_path="/source/path",
+    )
+
+    error_message = "File path '/some/relative/path/file.txt' does not match source_path '/source/path'"
+    with pytest.raises(ValueError, match=re.escape(error_message)):
+        reader.run(["/some/relative/path/file.txt"])
@@ -16,6 +16,45 @@ if TYPE_CHECKING:
     from pyspark.sql import DataFrame as SparkDataFrame
 
 
+def is_equal_spark_df(left_df: SparkDataFrame, right_df: SparkDataFrame) -> bool:
+    """
+    Checks that Spark dataframes contain the same rows without collecting them to the driver.
+    Rows order is ignored.
+
+    ``False`` means that dataframes cannot be compared this way, or they are not exactly equal,
+    so caller should fall back to comparing Pandas dataframes.
+    """
+
+    if not hasattr(left_df, "exceptAll"):
+        # Spark 2.3
+        return False
+
+    left_columns = {column.lower(): column for column in left_df.columns}
+    right_columns = {column.lower(): column for column in right_df.columns}
+    if len(left_columns) != len(left_df.columns) or len(right_columns) != len(right_df.columns):
+        # some columns differ only by case
+        return False
+
+    if left_columns.keys() != right_columns.keys():
+        return False
+
+    # ignore columns order and case
+    column_names = sorted(left_columns.keys())
+    left_df = left_df.select(*[left_df[left_columns[name]].alias(name) for name in column_names])
+    right_df = right_df.select(*[right_df[right_columns[name]].alias(name) for name in column_names])
+
+    left_types = [field.dataType for field in left_df.schema]
+    right_types = [field.dataType for field in right_df.schema]
+    if left_types != right_types:
+        return False
+
+    try:
+        return not left_df.exceptAll(right_df).take(1) and not right_df.exceptAll(left_df).take(1)
+    except Exception:
+        # some column types, like MapType, cannot be compared by Spark
+        return False
+
+
 def assert_equal_df(
     left_df: pandas.DataFrame | SparkDataFrame,
     right_df: pandas.DataFrame | SparkDataFrame,
@@ -24,6 +63,11 @@ def assert_equal_df(
 ) -> None:
     """Checks that right_df equal to left_df"""
 
+    # exceptAll ignores rows order, so use it only if order is not checked anyway
+    both_spark_df = not isinstance(left_df, pandas.DataFrame) and not isinstance(right_df, pandas.DataFrame)
+    if order_by and both_spark_df and is_equal_spark_df(left_df, right_df):
+        return
+
     # Oracle returns column names in UPPERCASE, convert them back to lowercase
     # Nota: this is only for dataframe comparison purpose
     left_df = lowercase_columns(to_pandas(left_df))